@@ -0,0 +1,71 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+Matches the tables previously created by Base.metadata.create_all().
+Databases that were bootstrapped that way should run `alembic stamp 0001`
+once instead of upgrading.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+media_type = postgresql.ENUM("movie", "tv", name="mediatype", create_type=False)
+rating_value = postgresql.ENUM("skip", "timepass", "go_for_it", "perfection", name="ratingvalue", create_type=False)
+
+def upgrade():
+    bind = op.get_bind()
+    media_type.create(bind, checkfirst=True)
+    rating_value.create(bind, checkfirst=True)
+
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "watchlist",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("tmdb_id", sa.Integer(), nullable=False),
+        sa.Column("media_type", media_type, nullable=False),
+        sa.Column("added_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("user_id", "tmdb_id", "media_type", name="unique_user_media"),
+    )
+
+    op.create_table(
+        "ratings",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("tmdb_id", sa.Integer(), nullable=False),
+        sa.Column("media_type", media_type, nullable=False),
+        sa.Column("rating", rating_value, nullable=False),
+        sa.Column("rated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.UniqueConstraint("user_id", "tmdb_id", "media_type", name="unique_user_rating"),
+    )
+
+def downgrade():
+    op.drop_table("ratings")
+    op.drop_table("watchlist")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_username", table_name="users")
+    op.drop_table("users")
+
+    bind = op.get_bind()
+    rating_value.drop(bind, checkfirst=True)
+    media_type.drop(bind, checkfirst=True)
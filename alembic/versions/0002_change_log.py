@@ -0,0 +1,41 @@
+"""change log for delta sync
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+change_entity = postgresql.ENUM("watchlist", "ratings", name="changeentity", create_type=False)
+change_op = postgresql.ENUM("upsert", "delete", name="changeop", create_type=False)
+
+def upgrade():
+    bind = op.get_bind()
+    change_entity.create(bind, checkfirst=True)
+    change_op.create(bind, checkfirst=True)
+
+    op.create_table(
+        "change_log",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("entity", change_entity, nullable=False),
+        sa.Column("entity_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("op", change_op, nullable=False),
+        sa.Column("changed_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_change_log_user_entity_id", "change_log", ["user_id", "entity", "id"])
+
+def downgrade():
+    op.drop_index("ix_change_log_user_entity_id", table_name="change_log")
+    op.drop_table("change_log")
+
+    bind = op.get_bind()
+    change_op.drop(bind, checkfirst=True)
+    change_entity.drop(bind, checkfirst=True)
@@ -0,0 +1,40 @@
+"""local titles catalog
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# Created in 0001
+media_type = postgresql.ENUM("movie", "tv", name="mediatype", create_type=False)
+
+def upgrade():
+    op.create_table(
+        "titles",
+        sa.Column("tmdb_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("media_type", media_type, primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("original_title", sa.String()),
+        sa.Column("release_date", sa.Date()),
+        sa.Column("release_year", sa.Integer()),
+        sa.Column("genre_ids", postgresql.ARRAY(sa.Integer()), nullable=False, server_default="{}"),
+        sa.Column("popularity", sa.Float()),
+        sa.Column("adult", sa.Boolean(), nullable=False, server_default="false"),
+        sa.Column("poster_path", sa.String()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_titles_release_year", "titles", ["release_year"])
+    op.create_index("ix_titles_genre_ids", "titles", ["genre_ids"], postgresql_using="gin")
+
+def downgrade():
+    op.drop_index("ix_titles_genre_ids", table_name="titles")
+    op.drop_index("ix_titles_release_year", table_name="titles")
+    op.drop_table("titles")
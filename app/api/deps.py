@@ -1,35 +1,78 @@
 import jwt
+import redis
+from contextlib import contextmanager
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jwt.exceptions import InvalidTokenError as JWTError
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db, get_replica_session, replica_router
 from app.models.user import User
+from app.services.cache import cache_service
 
 security = HTTPBearer()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+def _recent_write_key(user_id) -> str:
+    return f"db:recent_write:{user_id}"
+
+def mark_recent_write(user_id):
+    """Pin the user's reads to the primary until replicas have caught up"""
+    if not replica_router.engines:
+        return
+    try:
+        cache_service.redis_client.setex(_recent_write_key(user_id), settings.READ_YOUR_WRITES_SECONDS, 1)
+    except redis.RedisError:
+        pass
+
+def has_recent_write(user_id) -> bool:
+    try:
+        return bool(cache_service.redis_client.exists(_recent_write_key(user_id)))
+    except redis.RedisError:
+        # Without the marker we can't tell, so stay on the primary
+        return True
+
+def get_token_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(credentials.credentials, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
+    return user_id
+
+@contextmanager
+def read_session(user_id: str):
+    """Session for read-only work: a replica, or the primary right after the user's own write"""
+    if not replica_router.engines or has_recent_write(user_id):
+        db = SessionLocal()
+    else:
+        db = get_replica_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def load_user(db: Session, user_id: str) -> User:
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise credentials_exception
     
-    return user
\ No newline at end of file
+    return user
+
+async def get_current_user(
+    user_id: str = Depends(get_token_user_id),
+    db: Session = Depends(get_db)
+) -> User:
+    """Authenticated user, loaded on the primary session the handler also uses.
+
+    Read-only handlers that want a replica resolve the user themselves via
+    read_session() and load_user().
+    """
+    return load_user(db, user_id)
\ No newline at end of file
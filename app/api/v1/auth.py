@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
+from app.api.deps import mark_recent_write
 from app.models.user import User
 from app.schemas.token import Token
 from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token, create_password_reset_token, verify_password_reset_token
@@ -29,6 +30,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     db.add(user)
     db.commit()
     db.refresh(user)
+    mark_recent_write(user.id)
     
     return user
 
@@ -87,5 +89,6 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
     # Update password
     user.password_hash = get_password_hash(request.new_password)
     db.commit()
+    mark_recent_write(user.id)
     
     return {"message": "Password reset successful"}
\ No newline at end of file
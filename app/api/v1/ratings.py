@@ -1,21 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.api.deps import get_current_user
+from typing import List, Optional
+from app.core.database import SessionLocal, get_db
+from app.api.deps import get_current_user, get_token_user_id, load_user, mark_recent_write, read_session
 from app.models.user import User
+from app.models.change_log import ChangeEntity, ChangeOp
 from app.models.rating import Rating
-from app.schemas.rating import RatingCreate, RatingUpdate, RatingResponse
+from app.schemas.rating import RatingCreate, RatingUpdate, RatingResponse, RatingChanges
+from app.services.changes import get_changes, get_snapshot, record_change
+from app.services.user_cache import user_list_cache
 
 router = APIRouter()
 
+ratings_adapter = TypeAdapter(List[RatingResponse])
+
 @router.get("", response_model=List[RatingResponse])
-def get_ratings(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+def get_ratings(user_id: str = Depends(get_token_user_id)):
+    # Cache hits are served pre-serialized without touching the database
+    version = user_list_cache.get_version("ratings", user_id)
+    if version is not None:
+        cached = user_list_cache.get("ratings", user_id, version)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
+    # Misses mostly follow a write, and the body is pinned until the next one,
+    # so build it from the primary rather than a possibly lagging replica
+    with SessionLocal() as db:
+        current_user = load_user(db, user_id)
+        ratings = db.query(Rating).filter(Rating.user_id == current_user.id).all()
+        body = ratings_adapter.dump_json(ratings_adapter.validate_python(ratings, from_attributes=True)).decode()
+    
+    if version is not None:
+        user_list_cache.set("ratings", user_id, version, body)
+    return Response(content=body, media_type="application/json")
+
+@router.get("/changes", response_model=RatingChanges)
+def get_rating_changes(
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    user_id: str = Depends(get_token_user_id)
 ):
-    ratings = db.query(Rating).filter(Rating.user_id == current_user.id).all()
-    return ratings
+    """Changes after `since`; omit it for a full snapshot and a starting cursor"""
+    with read_session(user_id) as db:
+        current_user = load_user(db, user_id)
+        if since is None:
+            cursor, rows = get_snapshot(db, current_user.id, ChangeEntity.ratings, Rating)
+            return {"cursor": cursor, "upserted": rows, "deleted": [], "has_more": False}
+        
+        cursor, upserted, deleted, has_more = get_changes(db, current_user.id, ChangeEntity.ratings, Rating, since, limit)
+        return {"cursor": cursor, "upserted": upserted, "deleted": deleted, "has_more": has_more}
 
 @router.post("", response_model=RatingResponse, status_code=201)
 def create_rating(
@@ -40,7 +74,11 @@ def create_rating(
         rating=data.rating
     )
     db.add(rating)
+    db.flush()
+    record_change(db, current_user.id, ChangeEntity.ratings, rating.id, ChangeOp.upsert)
     db.commit()
+    mark_recent_write(current_user.id)
+    user_list_cache.invalidate("ratings", current_user.id)
     db.refresh(rating)
     return rating
 
@@ -60,7 +98,10 @@ def update_rating(
         raise HTTPException(status_code=404, detail="Rating not found")
     
     rating.rating = data.rating
+    record_change(db, current_user.id, ChangeEntity.ratings, rating.id, ChangeOp.upsert)
     db.commit()
+    mark_recent_write(current_user.id)
+    user_list_cache.invalidate("ratings", current_user.id)
     db.refresh(rating)
     return rating
 
@@ -79,5 +120,8 @@ def delete_rating(
         raise HTTPException(status_code=404, detail="Rating not found")
     
     db.delete(rating)
+    record_change(db, current_user.id, ChangeEntity.ratings, rating.id, ChangeOp.delete)
     db.commit()
+    mark_recent_write(current_user.id)
+    user_list_cache.invalidate("ratings", current_user.id)
     return {"message": "Rating deleted"}
\ No newline at end of file
@@ -1,21 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
-from app.api.deps import get_current_user
+from typing import List, Optional
+from app.core.database import SessionLocal, get_db
+from app.api.deps import get_current_user, get_token_user_id, load_user, mark_recent_write, read_session
 from app.models.user import User
+from app.models.change_log import ChangeEntity, ChangeOp
 from app.models.watchlist import Watchlist
-from app.schemas.watchlist import WatchlistCreate, WatchlsitResponse
+from app.schemas.watchlist import WatchlistCreate, WatchlsitResponse, WatchlistChanges
+from app.services.changes import get_changes, get_snapshot, record_change
+from app.services.user_cache import user_list_cache
 
 router = APIRouter()
 
+watchlist_adapter = TypeAdapter(List[WatchlsitResponse])
+
 @router.get("", response_model=List[WatchlsitResponse])
-def get_watchlist(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+def get_watchlist(user_id: str = Depends(get_token_user_id)):
+    # Cache hits are served pre-serialized without touching the database
+    version = user_list_cache.get_version("watchlist", user_id)
+    if version is not None:
+        cached = user_list_cache.get("watchlist", user_id, version)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+    
+    # Misses mostly follow a write, and the body is pinned until the next one,
+    # so build it from the primary rather than a possibly lagging replica
+    with SessionLocal() as db:
+        current_user = load_user(db, user_id)
+        watchlist = db.query(Watchlist).filter(Watchlist.user_id == current_user.id).all()
+        body = watchlist_adapter.dump_json(watchlist_adapter.validate_python(watchlist, from_attributes=True)).decode()
+    
+    if version is not None:
+        user_list_cache.set("watchlist", user_id, version, body)
+    return Response(content=body, media_type="application/json")
+
+@router.get("/changes", response_model=WatchlistChanges)
+def get_watchlist_changes(
+    since: Optional[int] = Query(None, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    user_id: str = Depends(get_token_user_id)
 ):
-    watchlist = db.query(Watchlist).filter(Watchlist.user_id == current_user.id).all()
-    return watchlist
+    """Changes after `since`; omit it for a full snapshot and a starting cursor"""
+    with read_session(user_id) as db:
+        current_user = load_user(db, user_id)
+        if since is None:
+            cursor, rows = get_snapshot(db, current_user.id, ChangeEntity.watchlist, Watchlist)
+            return {"cursor": cursor, "upserted": rows, "deleted": [], "has_more": False}
+        
+        cursor, upserted, deleted, has_more = get_changes(db, current_user.id, ChangeEntity.watchlist, Watchlist, since, limit)
+        return {"cursor": cursor, "upserted": upserted, "deleted": deleted, "has_more": has_more}
 
 @router.post("", response_model=WatchlsitResponse, status_code=201)
 def add_to_watchlist(
@@ -38,7 +72,11 @@ def add_to_watchlist(
         media_type=data.media_type
     )
     db.add(watchlist_item)
+    db.flush()
+    record_change(db, current_user.id, ChangeEntity.watchlist, watchlist_item.id, ChangeOp.upsert)
     db.commit()
+    mark_recent_write(current_user.id)
+    user_list_cache.invalidate("watchlist", current_user.id)
     db.refresh(watchlist_item)
     return watchlist_item
 
@@ -57,5 +95,8 @@ def remove_from_watchlist(
         raise HTTPException(status_code=404, detail="Item not found")
     
     db.delete(item)
+    record_change(db, current_user.id, ChangeEntity.watchlist, item.id, ChangeOp.delete)
     db.commit()
+    mark_recent_write(current_user.id)
+    user_list_cache.invalidate("watchlist", current_user.id)
     return{"message": "Removed from watchlist"}
\ No newline at end of file
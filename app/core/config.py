@@ -4,6 +4,12 @@ from typing import List
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Comma-separated read replica URLs; empty means all reads use the primary
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_RETRY_SECONDS: int = 30
+    REPLICA_CONNECT_TIMEOUT: int = 2
+    REPLICA_CHECK_SECONDS: int = 10
+    READ_YOUR_WRITES_SECONDS: int = 5
     
     # Redis
     REDIS_URL: str
@@ -17,6 +23,7 @@ class Settings(BaseSettings):
     # TMDB
     TMDB_API_KEY: str
     TMDB_BASE_URL: str = "https://api.themoviedb.org/3"
+    TMDB_EXPORTS_URL: str = "http://files.tmdb.org/p/exports"
     
     # CORS
     ALLOWED_ORIGINS: str
@@ -28,6 +35,10 @@ class Settings(BaseSettings):
     def allowed_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
     
+    @property
+    def replica_urls_list(self) -> List[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,22 +1,101 @@
-from sqlalchemy import create_engine
+import itertools
+import time
+from typing import Dict, List, Optional
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
-)
+def _create_engine(url: str, **kwargs) -> Engine:
+    return create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        **kwargs
+    )
+
+engine = _create_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+class ReplicaRouter:
+    """Round-robin over read replicas, skipping ones that recently failed"""
+    
+    def __init__(self, engines: List[Engine], retry_after: int = 30):
+        self.engines = engines
+        self.retry_after = retry_after
+        self._counter = itertools.count()
+        self._down_until: Dict[int, float] = {}
+    
+    def get_engine(self) -> Optional[Engine]:
+        now = time.monotonic()
+        for _ in range(len(self.engines)):
+            index = next(self._counter) % len(self.engines)
+            if self._down_until.get(index, 0) <= now:
+                return self.engines[index]
+        return None
+    
+    def mark_down(self, replica: Engine):
+        self._down_until[self.engines.index(replica)] = time.monotonic() + self.retry_after
+    
+    def is_healthy(self, replica: Engine) -> bool:
+        return self._down_until.get(self.engines.index(replica), 0) <= time.monotonic()
+    
+    def probe(self):
+        """Run SELECT 1 on every replica so request threads don't discover dead ones"""
+        for index, replica in enumerate(self.engines):
+            try:
+                with replica.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                self._down_until.pop(index, None)
+            except OperationalError:
+                self.mark_down(replica)
+
+replica_router = ReplicaRouter(
+    [
+        _create_engine(url, connect_args={"connect_timeout": settings.REPLICA_CONNECT_TIMEOUT})
+        for url in settings.replica_urls_list
+    ],
+    retry_after=settings.REPLICA_RETRY_SECONDS
+)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_replica_session() -> Session:
+    """Open a session on a healthy replica, falling back to the primary"""
+    while True:
+        replica = replica_router.get_engine()
+        if replica is None:
+            return SessionLocal()
+        db = SessionLocal(bind=replica)
+        try:
+            # Check out a connection now so a dead replica is skipped before the handler runs
+            db.connection()
+            return db
+        except OperationalError:
+            db.close()
+            replica_router.mark_down(replica)
+
+def get_pool_stats() -> Dict[str, dict]:
+    def stats(e: Engine) -> dict:
+        return {
+            "size": e.pool.size(),
+            "checked_in": e.pool.checkedin(),
+            "checked_out": e.pool.checkedout(),
+            "overflow": e.pool.overflow(),
+        }
+    
+    result = {"primary": stats(engine)}
+    for index, replica in enumerate(replica_router.engines):
+        result[f"replica_{index}"] = {**stats(replica), "healthy": replica_router.is_healthy(replica)}
+    return result
\ No newline at end of file
@@ -1,16 +1,39 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.core.database import Base, engine
+from app.core.database import get_pool_stats, replica_router
 from app.api.v1 import api_router
+from app.services.cache import cache_service
+from app.services.email import email_service
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Schema is managed by Alembic migrations (`alembic upgrade head`),
+# so importing the app never opens a database connection.
+
+async def probe_replicas():
+    while True:
+        await asyncio.to_thread(replica_router.probe)
+        await asyncio.sleep(settings.REPLICA_CHECK_SECONDS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build service clients once per worker, after the process has forked
+    cache_service.connect()
+    email_service.configure()
+    probe_task = asyncio.create_task(probe_replicas()) if replica_router.engines else None
+    yield
+    if probe_task is not None:
+        probe_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await probe_task
+    cache_service.close()
 
 app = FastAPI(
     title="CineScope API",
     description="Movie and TV tracking platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS
@@ -31,4 +54,8 @@ def root():
 
 @app.get("/health")
 def health():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/db")
+def health_db():
+    return {"pools": get_pool_stats()}
\ No newline at end of file
@@ -1,5 +1,7 @@
 from app.models.user import User
 from app.models.watchlist import Watchlist, MediaType
 from app.models.rating import Rating, RatingValue
+from app.models.change_log import ChangeLog, ChangeEntity, ChangeOp
+from app.models.title import Title
 
-__all__ = ["User", "Watchlist", "Rating", "MediaType", "RatingValue"]
\ No newline at end of file
+__all__ = ["User", "Watchlist", "Rating", "MediaType", "RatingValue", "ChangeLog", "ChangeEntity", "ChangeOp", "Title"]
\ No newline at end of file
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, BigInteger, ForeignKey, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import enum
+from app.core.database import Base
+
+class ChangeEntity(str, enum.Enum):
+    watchlist = "watchlist"
+    ratings = "ratings"
+
+class ChangeOp(str, enum.Enum):
+    upsert = "upsert"
+    delete = "delete"
+
+class ChangeLog(Base):
+    """Append-only feed of a user's watchlist/rating changes; delete rows are the tombstones"""
+    __tablename__ = "change_log"
+    
+    # Monotonic sync cursor
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity = Column(SQLEnum(ChangeEntity), nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    op = Column(SQLEnum(ChangeOp), nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_change_log_user_entity_id", "user_id", "entity", "id"),
+    )
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import func
+from app.core.database import Base
+from app.models.watchlist import MediaType
+
+class Title(Base):
+    """Local copy of TMDB title metadata, keyed like watchlist/ratings rows for SQL joins"""
+    __tablename__ = "titles"
+    
+    tmdb_id = Column(Integer, primary_key=True, autoincrement=False)
+    media_type = Column(SQLEnum(MediaType), primary_key=True)
+    title = Column(String, nullable=False)
+    original_title = Column(String)
+    release_date = Column(Date)
+    release_year = Column(Integer)
+    genre_ids = Column(ARRAY(Integer), nullable=False, server_default="{}")
+    popularity = Column(Float)
+    adult = Column(Boolean, nullable=False, server_default="false")
+    poster_path = Column(String)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_titles_release_year", "release_year"),
+        Index("ix_titles_genre_ids", "genre_ids", postgresql_using="gin"),
+    )
\ No newline at end of file
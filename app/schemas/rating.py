@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import List
 from datetime import datetime
 import uuid
 from app.models.watchlist import MediaType
@@ -22,4 +23,10 @@ class RatingResponse(BaseModel):
     updated_at: datetime | None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class RatingChanges(BaseModel):
+    cursor: int
+    upserted: List[RatingResponse]
+    deleted: List[uuid.UUID]
+    has_more: bool
\ No newline at end of file
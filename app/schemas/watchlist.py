@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import List
 from datetime import datetime
 import uuid
 from app.models.watchlist import MediaType
@@ -15,4 +16,10 @@ class WatchlsitResponse(BaseModel):
     added_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class WatchlistChanges(BaseModel):
+    cursor: int
+    upserted: List[WatchlsitResponse]
+    deleted: List[uuid.UUID]
+    has_more: bool
\ No newline at end of file
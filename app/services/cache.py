@@ -5,7 +5,23 @@ from app.core.config import settings
 
 class CacheService:
     def __init__(self):
-        self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self._redis_client: Optional[redis.Redis] = None
+    
+    @property
+    def redis_client(self) -> redis.Redis:
+        """Redis client, created on first use"""
+        if self._redis_client is None:
+            self.connect()
+        return self._redis_client
+    
+    def connect(self):
+        if self._redis_client is None:
+            self._redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    
+    def close(self):
+        if self._redis_client is not None:
+            self._redis_client.close()
+            self._redis_client = None
     
     def get(self, key: str) -> Optional[Any]:
         data = self.redis_client.get(key)
@@ -0,0 +1,206 @@
+import asyncio
+import gzip
+import json
+import zlib
+import httpx
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.title import Title
+from app.models.watchlist import MediaType
+
+EXPORT_FILES = {MediaType.movie: "movie_ids", MediaType.tv: "tv_series_ids"}
+
+# Export rows only carry these; titles already in the catalog just get them refreshed.
+# tv_series_ids rows have no "adult" key, so refreshing it would reset the detail value.
+EXPORT_COLUMNS = {
+    MediaType.movie: ["original_title", "popularity", "adult"],
+    MediaType.tv: ["original_title", "popularity"],
+}
+DETAIL_COLUMNS = ["title", "original_title", "release_date", "release_year", "genre_ids", "popularity", "adult", "poster_path"]
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+def build_title_row(media_type: MediaType, export_row: Dict[str, Any], detail: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Map an export line plus optional /movie or /tv detail payload to a titles row"""
+    detail = detail or {}
+    is_movie = media_type == MediaType.movie
+    original_key = "original_title" if is_movie else "original_name"
+    original_title = detail.get(original_key) or export_row.get(original_key)
+    release_date = _parse_date(detail.get("release_date" if is_movie else "first_air_date"))
+    return {
+        "tmdb_id": export_row["id"],
+        "media_type": media_type,
+        "title": detail.get("title" if is_movie else "name") or original_title or "",
+        "original_title": original_title,
+        "release_date": release_date,
+        "release_year": release_date.year if release_date else None,
+        "genre_ids": [genre["id"] for genre in detail.get("genres", [])],
+        "popularity": detail.get("popularity", export_row.get("popularity")),
+        "adult": bool(detail.get("adult", export_row.get("adult", False))),
+        "poster_path": detail.get("poster_path"),
+    }
+
+def upsert_titles(db: Session, rows: List[Dict[str, Any]], update_columns: List[str]):
+    """Multi-row INSERT ... ON CONFLICT DO UPDATE of only `update_columns`"""
+    if not rows:
+        return
+    stmt = insert(Title).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Title.tmdb_id, Title.media_type],
+        set_={**{column: stmt.excluded[column] for column in update_columns}, "updated_at": func.now()}
+    )
+    db.execute(stmt)
+
+def load_details(path: str) -> Dict[int, Dict[str, Any]]:
+    """Detail payloads from a local JSON-lines file, keyed by TMDB id"""
+    return {row["id"]: row for row in _iter_local_lines(path)}
+
+def _iter_local_lines(path: str) -> Iterable[Dict[str, Any]]:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+class CatalogService:
+    def __init__(self):
+        self.base_url = settings.TMDB_BASE_URL
+        self.api_key = settings.TMDB_API_KEY
+        self.exports_url = settings.TMDB_EXPORTS_URL
+    
+    def export_url(self, media_type: MediaType, day: date) -> str:
+        return f"{self.exports_url}/{EXPORT_FILES[media_type]}_{day:%m_%d_%Y}.json.gz"
+    
+    async def iter_export(self, source: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream export rows from a URL or local file (plain or gzipped JSON lines)"""
+        if not source.startswith(("http://", "https://")):
+            for row in _iter_local_lines(source):
+                yield row
+            return
+        
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if source.endswith(".gz") else None
+        buffer = b""
+        async with httpx.AsyncClient(timeout=60) as client:
+            async with client.stream("GET", source) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    buffer += decompressor.decompress(chunk) if decompressor else chunk
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        if line.strip():
+                            yield json.loads(line)
+        if decompressor:
+            buffer += decompressor.flush()
+        if buffer.strip():
+            yield json.loads(buffer)
+    
+    async def fetch_details(
+        self,
+        client: httpx.AsyncClient,
+        media_type: MediaType,
+        ids: List[int],
+        concurrency: int = 20
+    ) -> Dict[int, Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(tmdb_id: int):
+            try:
+                async with semaphore:
+                    for _ in range(3):
+                        response = await client.get(
+                            f"{self.base_url}/{media_type.value}/{tmdb_id}",
+                            params={"api_key": self.api_key}
+                        )
+                        if response.status_code != 429:
+                            break
+                        await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+                # Ids in the export can be removed from TMDB before we get to them
+                if response.status_code == 404:
+                    return tmdb_id, None
+                response.raise_for_status()
+                return tmdb_id, response.json()
+            except httpx.HTTPError as e:
+                # One bad id must not abort the run; it is retried next time.
+                # The exception text includes the request URL (and api_key), so log only its kind.
+                reason = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else type(e).__name__
+                print(f"TMDB {media_type.value} {tmdb_id} details failed: {reason}")
+                return tmdb_id, None
+        
+        results = await asyncio.gather(*(fetch(tmdb_id) for tmdb_id in ids))
+        return {tmdb_id: detail for tmdb_id, detail in results if detail is not None}
+    
+    async def ingest(
+        self,
+        db: Session,
+        source: str,
+        media_type: MediaType,
+        batch_size: int = 1000,
+        concurrency: int = 20,
+        details: Optional[Dict[int, Dict[str, Any]]] = None,
+        refresh: bool = False
+    ) -> Dict[str, int]:
+        """Stream an export into the titles table in batches, one commit per batch.
+
+        New ids get a detail lookup (from `details` when given, else the TMDB
+        API) and are only stored once a payload is found; ids already in the
+        catalog only have their export columns refreshed unless `refresh` is set.
+        """
+        stats = {"seen": 0, "detailed": 0, "missing": 0, "refreshed": 0}
+        batch: Dict[int, Dict[str, Any]] = {}
+        
+        async with httpx.AsyncClient(timeout=30) as client:
+            async for row in self.iter_export(source):
+                batch[row["id"]] = row
+                if len(batch) >= batch_size:
+                    await self._ingest_batch(db, client, media_type, batch, concurrency, details, refresh, stats)
+                    batch = {}
+            if batch:
+                await self._ingest_batch(db, client, media_type, batch, concurrency, details, refresh, stats)
+        
+        return stats
+    
+    async def _ingest_batch(
+        self,
+        db: Session,
+        client: httpx.AsyncClient,
+        media_type: MediaType,
+        batch: Dict[int, Dict[str, Any]],
+        concurrency: int,
+        details: Optional[Dict[int, Dict[str, Any]]],
+        refresh: bool,
+        stats: Dict[str, int]
+    ):
+        existing = set()
+        if not refresh:
+            existing = {
+                tmdb_id for (tmdb_id,) in db.query(Title.tmdb_id).filter(
+                    Title.media_type == media_type,
+                    Title.tmdb_id.in_(list(batch))
+                )
+            }
+        new_ids = [tmdb_id for tmdb_id in batch if tmdb_id not in existing]
+        
+        if details is not None:
+            payloads = {tmdb_id: details[tmdb_id] for tmdb_id in new_ids if tmdb_id in details}
+        else:
+            payloads = await self.fetch_details(client, media_type, new_ids, concurrency)
+        
+        # Ids without a payload are left out rather than stored as stubs, so the next run retries them
+        upsert_titles(db, [build_title_row(media_type, batch[tmdb_id], payload) for tmdb_id, payload in payloads.items()], DETAIL_COLUMNS)
+        upsert_titles(db, [build_title_row(media_type, batch[tmdb_id]) for tmdb_id in existing], EXPORT_COLUMNS[media_type])
+        db.commit()
+        
+        stats["seen"] += len(batch)
+        stats["detailed"] += len(payloads)
+        stats["missing"] += len(new_ids) - len(payloads)
+        stats["refreshed"] += len(existing)
+
+catalog_service = CatalogService()
\ No newline at end of file
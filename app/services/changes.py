@@ -0,0 +1,59 @@
+from typing import Any, List, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.user import User
+from app.models.change_log import ChangeLog, ChangeEntity, ChangeOp
+
+def record_change(db: Session, user_id, entity: ChangeEntity, entity_id, op: ChangeOp):
+    """Append a change in the caller's transaction; commit is left to the caller"""
+    # Serialize this user's writes so cursor ids become visible in order
+    # and a client can never advance past a change that commits later
+    db.query(User.id).filter(User.id == user_id).with_for_update(key_share=True).first()
+    db.add(ChangeLog(user_id=user_id, entity=entity, entity_id=entity_id, op=op))
+
+def get_snapshot(db: Session, user_id, entity: ChangeEntity, model: Any) -> Tuple[int, List[Any]]:
+    """Full list plus the cursor to sync from next"""
+    # Read the cursor first: anything written in between is re-sent next time
+    cursor = db.query(func.max(ChangeLog.id)).filter(
+        ChangeLog.user_id == user_id,
+        ChangeLog.entity == entity
+    ).scalar() or 0
+    rows = db.query(model).filter(model.user_id == user_id).all()
+    return cursor, rows
+
+def get_changes(
+    db: Session,
+    user_id,
+    entity: ChangeEntity,
+    model: Any,
+    since: int,
+    limit: int
+) -> Tuple[int, List[Any], List[Any], bool]:
+    """Rows upserted and ids deleted after `since`, collapsed to each row's latest change"""
+    changes = db.query(ChangeLog).filter(
+        ChangeLog.user_id == user_id,
+        ChangeLog.entity == entity,
+        ChangeLog.id > since
+    ).order_by(ChangeLog.id).limit(limit + 1).all()
+    
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if not changes:
+        return since, [], [], False
+    
+    latest = {}
+    for change in changes:
+        latest[change.entity_id] = change.op
+    
+    upserted_ids = [entity_id for entity_id, op in latest.items() if op == ChangeOp.upsert]
+    deleted_ids = [entity_id for entity_id, op in latest.items() if op == ChangeOp.delete]
+    
+    # A row missing here was deleted after this page; its tombstone arrives on the next one
+    upserted = []
+    if upserted_ids:
+        upserted = db.query(model).filter(
+            model.user_id == user_id,
+            model.id.in_(upserted_ids)
+        ).all()
+    
+    return changes[-1].id, upserted, deleted_ids, has_more
\ No newline at end of file
@@ -1,11 +1,17 @@
-import resend
 from app.core.config import settings
 
-resend.api_key = settings.RESEND_API_KEY
-
 class EmailService:
     def __init__(self):
         self.from_email = settings.EMAIL_FROM
+        self._client = None
+    
+    def configure(self):
+        """Import and configure the Resend SDK on first use"""
+        if self._client is None:
+            import resend
+            resend.api_key = settings.RESEND_API_KEY
+            self._client = resend
+        return self._client
     
     async def send_password_reset_email(self, to_email: str, reset_token: str) -> bool:
         """Send password reset email with token link"""
@@ -30,7 +36,7 @@ class EmailService:
                 """
             }
             
-            resend.Emails.send(params)
+            self.configure().Emails.send(params)
             return True
         except Exception as e:
             print(f"Email send failed: {e}")
@@ -0,0 +1,48 @@
+import redis
+from typing import Optional
+from app.services.cache import cache_service
+
+class UserListCache:
+    """Pre-serialized per-user list responses (watchlist, ratings).
+
+    Each user/list pair has a version counter; bodies are stored under the
+    current version. Writes bump the counter with a single INCR, so a body
+    computed from data read before the write lands under the old version and
+    is never served.
+    """
+    
+    def __init__(self, ttl: int = 600):
+        self.ttl = ttl
+    
+    def _version_key(self, name: str, user_id) -> str:
+        return f"{name}:version:{user_id}"
+    
+    def _body_key(self, name: str, user_id, version: int) -> str:
+        return f"{name}:body:{user_id}:v{version}"
+    
+    def get_version(self, name: str, user_id) -> Optional[int]:
+        try:
+            return int(cache_service.redis_client.get(self._version_key(name, user_id)) or 0)
+        except redis.RedisError:
+            return None
+    
+    def get(self, name: str, user_id, version: int) -> Optional[str]:
+        try:
+            return cache_service.redis_client.get(self._body_key(name, user_id, version))
+        except redis.RedisError:
+            return None
+    
+    def set(self, name: str, user_id, version: int, body: str):
+        try:
+            cache_service.redis_client.setex(self._body_key(name, user_id, version), self.ttl, body)
+        except redis.RedisError:
+            pass
+    
+    def invalidate(self, name: str, user_id):
+        # The counter never expires: a reset would let an old body be served again
+        try:
+            cache_service.redis_client.incr(self._version_key(name, user_id))
+        except redis.RedisError:
+            pass
+
+user_list_cache = UserListCache()
\ No newline at end of file
@@ -0,0 +1,155 @@
+import asyncio
+import gzip
+import os
+import shutil
+import httpx
+from datetime import date
+from app.models.watchlist import MediaType
+from app.services import catalog
+from app.services.catalog import build_title_row, catalog_service, load_details
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+MOVIE_IDS = os.path.join(FIXTURES, "movie_ids_sample.json")
+MOVIE_DETAILS = os.path.join(FIXTURES, "movie_details_sample.json")
+TV_IDS = os.path.join(FIXTURES, "tv_series_ids_sample.json")
+TV_DETAILS = os.path.join(FIXTURES, "tv_details_sample.json")
+
+def read_export(source: str):
+    async def collect():
+        return [row async for row in catalog_service.iter_export(source)]
+    return asyncio.run(collect())
+
+def test_iter_export_plain():
+    rows = read_export(MOVIE_IDS)
+    assert [row["id"] for row in rows] == [550, 603, 13, 129, 999999999]
+    assert rows[0]["original_title"] == "Fight Club"
+
+def test_iter_export_gzipped(tmp_path):
+    gz_path = str(tmp_path / "movie_ids_sample.json.gz")
+    with open(MOVIE_IDS, "rb") as src, gzip.open(gz_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    
+    assert read_export(gz_path) == read_export(MOVIE_IDS)
+
+def test_build_movie_row_from_details():
+    details = load_details(MOVIE_DETAILS)
+    export_row = read_export(MOVIE_IDS)[3]
+    
+    row = build_title_row(MediaType.movie, export_row, details[export_row["id"]])
+    
+    assert row["tmdb_id"] == 129
+    assert row["media_type"] == MediaType.movie
+    assert row["title"] == "Spirited Away"
+    assert row["original_title"] == "千と千尋の神隠し"
+    assert row["release_date"] == date(2001, 7, 20)
+    assert row["release_year"] == 2001
+    assert row["genre_ids"] == [16, 10751, 14]
+    assert row["poster_path"] == "/39wmItIWsg5sZMyRUHLkWBcuVCM.jpg"
+
+class RecordingSession:
+    def commit(self):
+        pass
+
+def test_ingest_skips_ids_without_details(monkeypatch):
+    upserts = []
+    monkeypatch.setattr(catalog, "upsert_titles", lambda db, rows, columns: upserts.append((rows, columns)))
+    
+    stats = asyncio.run(catalog_service.ingest(
+        RecordingSession(),
+        MOVIE_IDS,
+        MediaType.movie,
+        batch_size=2,
+        details=load_details(MOVIE_DETAILS),
+        refresh=True
+    ))
+    
+    stored = [row["tmdb_id"] for rows, columns in upserts if columns == catalog.DETAIL_COLUMNS for row in rows]
+    assert sorted(stored) == [13, 129, 550, 603]
+    assert stats == {"seen": 5, "detailed": 4, "missing": 1, "refreshed": 0}
+
+def test_build_export_only_row():
+    export_row = read_export(MOVIE_IDS)[4]
+    
+    row = build_title_row(MediaType.movie, export_row)
+    
+    assert row["title"] == "Removed Upstream"
+    assert row["popularity"] == 0.6
+    assert row["release_year"] is None
+    assert row["genre_ids"] == []
+
+def test_build_tv_row_maps_name_and_first_air_date():
+    details = load_details(TV_DETAILS)
+    export_row = read_export(TV_IDS)[0]
+    
+    row = build_title_row(MediaType.tv, export_row, details[export_row["id"]])
+    
+    assert row["media_type"] == MediaType.tv
+    assert row["title"] == "Breaking Bad"
+    assert row["original_title"] == "Breaking Bad"
+    assert row["release_date"] == date(2008, 1, 20)
+    assert row["release_year"] == 2008
+    assert row["genre_ids"] == [18, 80]
+
+def test_build_tv_row_falls_back_to_original_name():
+    row = build_title_row(MediaType.tv, read_export(TV_IDS)[1])
+    
+    assert row["title"] == "Game of Thrones"
+    assert row["original_title"] == "Game of Thrones"
+    assert row["popularity"] == 98.3
+
+def test_build_row_with_bad_dates():
+    details = load_details(TV_DETAILS)
+    exports = {row["id"]: row for row in read_export(TV_IDS)}
+    
+    # Empty and malformed first_air_date both map to no date rather than raising
+    for tmdb_id in (1399, 66732):
+        row = build_title_row(MediaType.tv, exports[tmdb_id], details[tmdb_id])
+        assert row["release_date"] is None
+        assert row["release_year"] is None
+        assert row["genre_ids"]
+
+def test_fetch_details_skips_failed_ids(capsys):
+    def handler(request: httpx.Request) -> httpx.Response:
+        tmdb_id = int(request.url.path.rsplit("/", 1)[-1])
+        if tmdb_id == 1:
+            return httpx.Response(503)
+        if tmdb_id == 2:
+            return httpx.Response(404)
+        if tmdb_id == 3:
+            raise httpx.ConnectTimeout("timed out", request=request)
+        return httpx.Response(200, json={"id": tmdb_id, "title": "Ok"})
+    
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await catalog_service.fetch_details(client, MediaType.movie, [1, 2, 3, 4])
+    
+    assert asyncio.run(fetch()) == {4: {"id": 4, "title": "Ok"}}
+    output = capsys.readouterr().out
+    assert "503" in output and "ConnectTimeout" in output
+    assert "api_key" not in output
+
+class ExistingTitlesSession(RecordingSession):
+    def __init__(self, existing_ids):
+        self.existing_ids = existing_ids
+    
+    def query(self, *entities):
+        return self
+    
+    def filter(self, *criteria):
+        return [(tmdb_id,) for tmdb_id in self.existing_ids]
+
+def test_tv_refresh_keeps_adult_from_details(monkeypatch):
+    upserts = []
+    monkeypatch.setattr(catalog, "upsert_titles", lambda db, rows, columns: upserts.append((rows, columns)))
+    
+    stats = asyncio.run(catalog_service.ingest(
+        ExistingTitlesSession([1396]),
+        TV_IDS,
+        MediaType.tv,
+        details=load_details(TV_DETAILS)
+    ))
+    
+    refreshed = [(rows, columns) for rows, columns in upserts if columns != catalog.DETAIL_COLUMNS]
+    assert [row["tmdb_id"] for row in refreshed[0][0]] == [1396]
+    assert "adult" not in refreshed[0][1]
+    assert stats["refreshed"] == 1 and stats["detailed"] == 2
@@ -0,0 +1,104 @@
+from contextlib import contextmanager
+from sqlalchemy.exc import OperationalError
+from app.core import database
+from app.core.database import ReplicaRouter
+
+def connection_error():
+    return OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+class FakeEngine:
+    def __init__(self, name, up=True):
+        self.name = name
+        self.up = up
+    
+    @contextmanager
+    def connect(self):
+        if not self.up:
+            raise connection_error()
+        yield self
+    
+    def execute(self, statement):
+        pass
+
+class FakeSession:
+    def __init__(self, bind=None):
+        self.bind = bind
+        self.closed = False
+    
+    def connection(self):
+        if self.bind is not None and not self.bind.up:
+            raise connection_error()
+    
+    def close(self):
+        self.closed = True
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+def make_router(monkeypatch, *engines, retry_after=30):
+    clock = Clock()
+    monkeypatch.setattr(database.time, "monotonic", clock)
+    return ReplicaRouter(list(engines), retry_after=retry_after), clock
+
+def test_round_robin(monkeypatch):
+    a, b = FakeEngine("a"), FakeEngine("b")
+    router, _ = make_router(monkeypatch, a, b)
+    
+    assert [router.get_engine().name for _ in range(4)] == ["a", "b", "a", "b"]
+
+def test_mark_down_skips_until_retry_expires(monkeypatch):
+    a, b = FakeEngine("a"), FakeEngine("b")
+    router, clock = make_router(monkeypatch, a, b)
+    
+    router.mark_down(a)
+    assert not router.is_healthy(a)
+    assert [router.get_engine().name for _ in range(3)] == ["b", "b", "b"]
+    
+    clock.now += 30
+    assert router.is_healthy(a)
+    assert {router.get_engine().name for _ in range(2)} == {"a", "b"}
+
+def test_all_down_returns_none(monkeypatch):
+    a = FakeEngine("a")
+    router, _ = make_router(monkeypatch, a)
+    
+    router.mark_down(a)
+    assert router.get_engine() is None
+
+def test_probe_marks_down_and_recovers(monkeypatch):
+    a, b = FakeEngine("a", up=False), FakeEngine("b")
+    router, _ = make_router(monkeypatch, a, b)
+    
+    router.probe()
+    assert not router.is_healthy(a)
+    assert router.is_healthy(b)
+    
+    # Recovery is picked up by the next probe, without waiting out retry_after
+    a.up = True
+    router.probe()
+    assert router.is_healthy(a)
+
+def test_get_replica_session_skips_dead_replica(monkeypatch):
+    a, b = FakeEngine("a", up=False), FakeEngine("b")
+    router, _ = make_router(monkeypatch, a, b)
+    monkeypatch.setattr(database, "replica_router", router)
+    monkeypatch.setattr(database, "SessionLocal", FakeSession)
+    
+    db = database.get_replica_session()
+    
+    assert db.bind is b
+    assert not router.is_healthy(a)
+
+def test_get_replica_session_falls_back_to_primary(monkeypatch):
+    router, _ = make_router(monkeypatch, FakeEngine("a", up=False), FakeEngine("b", up=False))
+    monkeypatch.setattr(database, "replica_router", router)
+    monkeypatch.setattr(database, "SessionLocal", FakeSession)
+    
+    db = database.get_replica_session()
+    
+    # SessionLocal() without a bind override is the primary
+    assert db.bind is None
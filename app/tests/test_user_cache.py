@@ -0,0 +1,69 @@
+import pytest
+import redis
+from app.services.cache import cache_service
+from app.services.user_cache import UserListCache
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+    
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("redis is down")
+        return fail
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache_service, "_redis_client", client)
+    return client
+
+def test_hit_at_current_version(fake_redis):
+    cache = UserListCache()
+    version = cache.get_version("watchlist", "u1")
+    
+    assert version == 0
+    assert cache.get("watchlist", "u1", version) is None
+    
+    cache.set("watchlist", "u1", version, "[]")
+    assert cache.get("watchlist", "u1", cache.get_version("watchlist", "u1")) == "[]"
+
+def test_invalidate_makes_old_body_unreachable(fake_redis):
+    cache = UserListCache()
+    version = cache.get_version("ratings", "u1")
+    
+    cache.invalidate("ratings", "u1")
+    # A body computed before the write lands under the old version
+    cache.set("ratings", "u1", version, '["stale"]')
+    
+    current = cache.get_version("ratings", "u1")
+    assert current == version + 1
+    assert cache.get("ratings", "u1", current) is None
+
+def test_versions_are_per_user_and_list(fake_redis):
+    cache = UserListCache()
+    cache.invalidate("watchlist", "u1")
+    
+    assert cache.get_version("watchlist", "u1") == 1
+    assert cache.get_version("watchlist", "u2") == 0
+    assert cache.get_version("ratings", "u1") == 0
+
+def test_redis_errors_are_a_miss(monkeypatch):
+    monkeypatch.setattr(cache_service, "_redis_client", BrokenRedis())
+    cache = UserListCache()
+    
+    assert cache.get_version("watchlist", "u1") is None
+    assert cache.get("watchlist", "u1", 0) is None
+    cache.set("watchlist", "u1", 0, "[]")
+    cache.invalidate("watchlist", "u1")
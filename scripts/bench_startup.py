@@ -0,0 +1,58 @@
+"""Benchmark worker cold start: `import app.main` and the lifespan startup.
+
+Each run happens in a fresh interpreter so module caches don't hide the
+real cost a new uvicorn worker or container pays.
+
+    python scripts/bench_startup.py --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import asyncio, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+
+async def startup():
+    async with app.main.app.router.lifespan_context(app.main.app):
+        return time.perf_counter()
+
+t2 = asyncio.run(startup())
+print(f"{t1 - t0:.6f} {t2 - t1:.6f}")
+"""
+
+def run_once() -> tuple[float, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(out[-2]), float(out[-1])
+
+def summarize(label: str, samples: list[float]):
+    ms = sorted(s * 1000 for s in samples)
+    print(
+        f"{label:<10} min {ms[0]:8.2f} ms   median {statistics.median(ms):8.2f} ms   "
+        f"max {ms[-1]:8.2f} ms"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+    print(f"{args.runs} cold starts")
+    summarize("import", [r[0] for r in results])
+    summarize("lifespan", [r[1] for r in results])
+
+if __name__ == "__main__":
+    main()
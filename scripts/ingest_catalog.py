@@ -0,0 +1,54 @@
+"""Load the local titles catalog from a TMDB daily ID export.
+
+    # yesterday's movie export, details from the TMDB API
+    python scripts/ingest_catalog.py --media-type movie
+
+    # local fixtures, no network
+    python scripts/ingest_catalog.py --media-type movie \\
+        --export app/tests/fixtures/movie_ids_sample.json \\
+        --details app/tests/fixtures/movie_details_sample.json
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import SessionLocal
+from app.models.watchlist import MediaType
+from app.services.catalog import catalog_service, load_details
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--media-type", type=MediaType, choices=list(MediaType), default=MediaType.movie)
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today() - timedelta(days=1),
+                        help="export date (default: yesterday)")
+    parser.add_argument("--export", help="local export file or URL instead of the dated TMDB export")
+    parser.add_argument("--details", help="local JSON-lines file of detail payloads instead of the TMDB API")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--refresh", action="store_true", help="re-fetch details for titles already in the catalog")
+    args = parser.parse_args()
+
+    source = args.export or catalog_service.export_url(args.media_type, args.date)
+    details = load_details(args.details) if args.details else None
+
+    db = SessionLocal()
+    try:
+        stats = asyncio.run(catalog_service.ingest(
+            db,
+            source,
+            args.media_type,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            details=details,
+            refresh=args.refresh
+        ))
+    finally:
+        db.close()
+    print(f"{source}: {stats['seen']} seen, {stats['detailed']} detailed, {stats['missing']} without details, {stats['refreshed']} refreshed")
+
+if __name__ == "__main__":
+    main()